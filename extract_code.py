@@ -0,0 +1,550 @@
+#!/usr/bin/env python3
+"""
+Extract code blocks from markdown output (e.g., from LLM responses).
+
+Usage:
+    ollama run gpt-oss "write a python script..." | extract-code.py > script.py
+    ollama run gpt-oss "write a bash script..." | extract-code.py --lang bash > script.sh
+    ollama run gpt-oss "write a python script..." | extract-code.py --strip-comments > script.py
+"""
+
+import argparse
+import io
+import sys
+import re
+
+# Patterns used by strip_comments, compiled once at import time
+# A triple-quoted string standing alone on its lines (fallback docstring removal)
+_PY_DOCSTRING = re.compile(
+    r'^[ \t]*(?P<q>"""|\'\'\')(?:(?!(?P=q)).)*(?P=q)[ \t]*$',
+    re.MULTILINE | re.DOTALL
+)
+# Comments are dropped; string literals are matched so that // or /* inside them survive
+_JS_STRIP = re.compile(
+    r'//[^\n]*'
+    r'|/\*.*?\*/'
+    r'|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`(?:\\.|[^`\\])*`',
+    re.DOTALL
+)
+# A # comment and the whitespace before it; \# and word\ # are left alone.
+# The lookahead gives the engine a first-character set, so it can skip ahead
+# instead of trying the lookbehind at every position
+_BASH_COMMENT = re.compile(r'(?=[ \t#])(?<![\\ \t])[ \t]*#.*$', re.MULTILINE)
+# A string opening a line, with only blank or comment lines before it
+_PY_BODY_STRING = r'(?:[ \t\f]*(?:#[^\r\n]*)?(?:\r\n|\r(?!\n)|\n))*[ \t\f]*[rRuU]?[\'"]'
+# Docstrings can only start like that at the top of the module or after a line
+# ending in ':'; the two are checked apart so the search can skip ahead to a ':'
+_PY_MODULE_DOCSTRING_START = re.compile(_PY_BODY_STRING)
+_PY_DOCSTRING_START = re.compile(r':[ \t\f]*(?:#[^\r\n]*)?(?:\r\n|\r(?!\n)|\n)' + _PY_BODY_STRING)
+# A backslash before a # on the same line, or on the line a backslash continues to;
+# escapes like these can hide a # from the per-line Python comment scanner
+_PY_BACKSLASH_HASH = re.compile(r'\\(?:\r\n?|\n)?[^\r\n]*#')
+# A run of more than one blank line
+_BLANK_RUN = re.compile(r'\n\s*\n\s*\n+')
+
+# Keywords used to guess the language of code that has no shebang, in priority order
+_LANG_KEYWORDS = (
+    ('python', ('import ', 'def ', 'class ')),
+    ('javascript', ('function ', 'const ', 'let ')),
+    ('bash', ('echo ', '[[', 'if [')),
+)
+
+# Shebang line for each language name or alias
+_SHEBANG_MAP = {
+    alias: shebang
+    for aliases, shebang in [
+        (('python', 'py'), '#!/usr/bin/env python3'),
+        (('bash', 'sh', 'shell'), '#!/bin/bash'),
+        (('javascript', 'js', 'node'), '#!/usr/bin/env node'),
+        (('ruby', 'rb'), '#!/usr/bin/env ruby'),
+        (('perl', 'pl'), '#!/usr/bin/env perl'),
+        (('php',), '#!/usr/bin/env php'),
+    ]
+    for alias in aliases
+}
+
+
+def _detect_language(code: str) -> str:
+    """
+    Guess the language of code from keywords.
+
+    Python keywords win over JavaScript ones, which win over bash ones.
+    Plain substring checks run in C and stop at the first hit.
+
+    Args:
+        code: Source code to inspect
+
+    Returns:
+        'python', 'javascript', 'bash', or None if nothing matched
+    """
+    for language, keywords in _LANG_KEYWORDS:
+        for keyword in keywords:
+            if keyword in code:
+                return language
+    return None
+
+
+def normalize(code: str, language: str = None, strip: bool = False) -> str:
+    """
+    Prepare extracted code for writing: add a shebang and optionally strip comments.
+
+    The language is resolved once and shared by both steps, so code without
+    a shebang is only scanned for language keywords a single time.
+
+    Args:
+        code: Source code to normalize
+        language: Programming language (python, bash, javascript, etc.)
+        strip: Also remove comments from the code
+
+    Returns:
+        Code with shebang line if missing, and comments removed if requested
+    """
+    # Only add a shebang if the first line is not already one
+    if not code.partition('\n')[0].strip().startswith('#!'):
+        # Detect language if not specified
+        if not language:
+            language = _detect_language(code)
+
+        shebang = _SHEBANG_MAP.get(language)
+        if shebang:
+            code = f"{shebang}\n{code}"
+
+    if strip:
+        code = strip_comments(code, language)
+
+    return code
+
+
+def ensure_shebang(code: str, language: str = None) -> str:
+    """
+    Ensure code has a valid shebang line at the beginning.
+
+    Args:
+        code: Source code to check
+        language: Programming language (python, bash, javascript, etc.)
+
+    Returns:
+        Code with shebang line if missing
+    """
+    return normalize(code, language)
+
+
+def _strip_python_source(code: str) -> str:
+    """
+    Remove comments and docstrings from Python code, keeping its formatting.
+
+    Docstrings are located with ast, so triple-quoted strings that are
+    assigned or passed around are left alone; comments are located with
+    tokenize, or with a per-line scan when no string can hide a #. A body
+    left empty by removing its docstring gets a 'pass'.
+
+    Args:
+        code: Python source code
+
+    Returns:
+        Code with comments and docstrings removed
+
+    Raises:
+        SyntaxError, ValueError, tokenize.TokenError: If the source cannot be parsed
+    """
+    import ast
+    import tokenize
+
+    # Split on \n, \r\n and \r, the line ends Python itself knows; str.splitlines()
+    # also breaks on \x0c, \x85, \u2028 and friends
+    lines = io.StringIO(code, newline='').readlines()
+    line_starts = [0]
+    for line in lines:
+        line_starts.append(line_starts[-1] + len(line))
+
+    # (start, end, replacement) character spans to rewrite
+    edits = []
+
+    # Parsing and tokenizing dominate the cost, so each is skipped when it
+    # cannot find anything
+    if _PY_MODULE_DOCSTRING_START.match(code) or _PY_DOCSTRING_START.search(code):
+        stack = [ast.parse(code)]
+        while stack:
+            node = stack.pop()
+            # Classes and functions only nest inside statement bodies, so
+            # expressions are never visited
+            for field in ('body', 'orelse', 'finalbody', 'handlers', 'cases'):
+                stack.extend(getattr(node, field, ()))
+            if not isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            if not node.body:
+                continue
+            first = node.body[0]
+            if not (isinstance(first, ast.Expr)
+                    and isinstance(first.value, ast.Constant)
+                    and isinstance(first.value.value, str)):
+                continue
+            # Only remove docstrings that sit on lines of their own
+            last_line = lines[first.end_lineno - 1]
+            head = lines[first.lineno - 1].encode()[:first.col_offset]
+            tail = last_line.encode()[first.end_col_offset:].strip()
+            if head.strip() or (tail and not tail.startswith(b'#')):
+                continue
+            replacement = ''
+            if len(node.body) == 1 and not isinstance(node, ast.Module):
+                replacement = head.decode() + 'pass' + last_line[len(last_line.rstrip('\r\n')):]
+            edits.append((line_starts[first.lineno - 1], line_starts[first.end_lineno], replacement))
+
+    if '#' in code:
+        if "'''" in code or '"""' in code or _PY_BACKSLASH_HASH.search(code):
+            # tokenize is pure Python and by far the slowest step, so it only
+            # runs when strings could hide a # from the per-line scanner
+            source = code
+            if '\r' in source:
+                # tokenize trips over a lone \r, so hand it \n line ends;
+                # the rows and columns of comments stay the same
+                source = source.replace('\r\n', '\n').replace('\r', '\n')
+            comments = ((tok.start[0] - 1, tok.start[1], tok.string)
+                        for tok in tokenize.generate_tokens(io.StringIO(source).readline)
+                        if tok.type == tokenize.COMMENT)
+        else:
+            comments = _scan_python_comments(lines)
+        for row, col, text in comments:
+            # Keep shebang on first line
+            if row == 0 and col == 0 and text.startswith('#!'):
+                continue
+            line_start = line_starts[row]
+            start = line_start + col
+            end = start + len(text)
+            # Take the whitespace before the comment with it
+            while start > line_start and code[start - 1] in ' \t':
+                start -= 1
+            edits.append((start, end, ''))
+
+    pieces = []
+    pos = 0
+    for start, end, replacement in sorted(edits):
+        if start < pos:
+            # Comment on a docstring line that is already gone
+            continue
+        pieces.append(code[pos:start])
+        pieces.append(replacement)
+        pos = end
+    pieces.append(code[pos:])
+    return ''.join(pieces)
+
+
+def _python_comment_start(line: str) -> int:
+    """
+    Find where a # comment starts on one line of Python code.
+
+    Quotes are tracked so that a # inside a single-line string is skipped;
+    triple-quoted strings and backslash continuations are not understood.
+
+    Args:
+        line: One line of Python source
+
+    Returns:
+        Index of the #, or -1 if the line has no comment
+    """
+    in_string = False
+    quote_char = None
+    for j, char in enumerate(line):
+        if char in ['"', "'"] and (j == 0 or line[j-1] != '\\'):
+            if not in_string:
+                in_string = True
+                quote_char = char
+            elif char == quote_char:
+                in_string = False
+        elif char == '#' and not in_string:
+            return j
+    return -1
+
+
+def _scan_python_comments(lines: list):
+    """
+    Yield the comments in Python source using the per-line scanner.
+
+    Args:
+        lines: Source lines, each with its line ending
+
+    Yields:
+        (row, col, text) tuples; row is 0-based
+    """
+    for row, line in enumerate(lines):
+        if '#' in line:
+            col = _python_comment_start(line)
+            if col >= 0:
+                yield (row, col, line[col:].rstrip('\r\n'))
+
+
+def _strip_python_lines(code: str) -> str:
+    """
+    Remove comments and docstrings from Python code line by line.
+
+    Args:
+        code: Python source code, possibly incomplete
+
+    Returns:
+        Code with comments and docstrings removed
+    """
+    # Remove # comments (but preserve shebangs)
+    lines = code.split('\n')
+    cleaned_lines = []
+    for i, line in enumerate(lines):
+        # Keep shebang on first line
+        if i == 0 and line.strip().startswith('#!'):
+            cleaned_lines.append(line)
+        else:
+            # Remove inline comments
+            # Handle strings to avoid removing # in strings
+            if '#' in line:
+                idx = _python_comment_start(line)
+                if idx >= 0:
+                    # Cut the comment and the whitespace before it
+                    line = line[:idx].rstrip()
+                cleaned_lines.append(line)
+            else:
+                cleaned_lines.append(line)
+
+    code = '\n'.join(cleaned_lines)
+
+    # Remove docstrings (""" and ''') in a single pass
+    code = _PY_DOCSTRING.sub('', code)
+
+    return code
+
+
+def _strip_python(code: str) -> str:
+    """
+    Remove comments and docstrings from Python code.
+
+    Args:
+        code: Python source code
+
+    Returns:
+        Code with comments and docstrings removed
+    """
+    # Imported lazily so non-Python runs do not pay for the compiler modules
+    import tokenize
+    try:
+        return _strip_python_source(code)
+    except (SyntaxError, ValueError, tokenize.TokenError):
+        # Source is incomplete or malformed; fall back to the line scanner
+        return _strip_python_lines(code)
+
+
+def _strip_bash(code: str) -> str:
+    """
+    Remove # comments from shell code, preserving the shebang.
+
+    Args:
+        code: Shell source code
+
+    Returns:
+        Code with comments removed
+    """
+    first, sep, rest = code.partition('\n')
+    if first.strip().startswith('#!'):
+        if '#' not in rest:
+            return code
+        return first + sep + _BASH_COMMENT.sub('', rest)
+    if '#' not in code:
+        return code
+    return _BASH_COMMENT.sub('', code)
+
+
+def _strip_javascript(code: str) -> str:
+    """
+    Remove // and /* */ comments in one pass, keeping string literals.
+
+    Args:
+        code: JavaScript or TypeScript source code
+
+    Returns:
+        Code with comments removed
+    """
+    # A match that opens with a quote is a string literal and is kept as is
+    return _JS_STRIP.sub(lambda m: m.group(0) if m.group(0)[0] in '"\'`' else '', code)
+
+
+# Comment stripper for each language name or alias
+_COMMENT_STRIPPERS = {
+    alias: stripper
+    for aliases, stripper in [
+        (('python', 'py'), _strip_python),
+        (('bash', 'sh', 'shell'), _strip_bash),
+        (('javascript', 'js', 'typescript', 'ts'), _strip_javascript),
+    ]
+    for alias in aliases
+}
+
+
+def strip_comments(code: str, language: str = None) -> str:
+    """
+    Remove comments from code while preserving functionality.
+
+    Args:
+        code: Source code to strip comments from
+        language: Programming language (python, bash, javascript, etc.)
+
+    Returns:
+        Code with comments removed
+    """
+    if not language:
+        # Try to detect language from code
+        if code.strip().startswith('#!/usr/bin/env python') or 'import ' in code or 'def ' in code:
+            language = 'python'
+        elif code.strip().startswith('#!/bin/bash') or code.strip().startswith('#!/bin/sh'):
+            language = 'bash'
+
+    stripper = _COMMENT_STRIPPERS.get(language)
+    if stripper:
+        code = stripper(code)
+
+    # Remove excessive blank lines
+    code = _BLANK_RUN.sub('\n\n', code)
+
+    return code
+
+
+def _is_fence_lang(lang: str) -> bool:
+    """
+    Check whether the text after an opening ``` is a valid language tag.
+
+    Matches the (\\w+)? group of the original fence regex: empty, or only
+    letters, digits and underscores.
+
+    Args:
+        lang: Text between the ``` and the end of its line
+
+    Returns:
+        True if the fence opens a code block
+    """
+    return not lang or lang.replace('_', 'a').isalnum()
+
+
+def _iter_blocks(text: str, pos: int = 0):
+    """
+    Yield ```language\ncode``` blocks one at a time, scanning left to right.
+
+    Args:
+        text: Input text containing markdown code blocks
+        pos: Offset to start scanning from
+
+    Yields:
+        (language, code) tuples; language is '' when the fence has none
+    """
+    while True:
+        start = text.find('```', pos)
+        if start < 0:
+            return
+        nl = text.find('\n', start + 3)
+        if nl < 0:
+            return
+        lang = text[start + 3:nl]
+        if not _is_fence_lang(lang):
+            # Not a fence opener (e.g. ```c++); retry from the next character
+            pos = start + 1
+            continue
+        end = text.find('```', nl + 1)
+        if end < 0:
+            return
+        yield (lang, text[nl + 1:end])
+        pos = end + 3
+
+
+def extract_code_blocks(text: str, language: str = None) -> tuple:
+    """
+    Extract code blocks from markdown-formatted text.
+
+    Args:
+        text: Input text containing markdown code blocks
+        language: Optional language filter (e.g., 'python', 'bash')
+
+    Returns:
+        Tuple of (extracted code content, detected language)
+    """
+    start = text.find('```')
+    if start < 0:
+        # Plain text with no fences at all: skip the scanner entirely
+        return (text, language)
+
+    # Common case, first block of any language: slice it out directly
+    if not language:
+        nl = text.find('\n', start + 3)
+        end = text.find('```', nl + 1) if nl >= 0 else -1
+        detected_lang = text[start + 3:nl]
+        if end >= 0 and _is_fence_lang(detected_lang):
+            return (text[nl + 1:end].strip(), detected_lang or language)
+
+    # Stop scanning at the first block that matches the language filter
+    wanted = language.lower() if language else None
+    found = False
+    for detected_lang, code in _iter_blocks(text, start):
+        if not wanted or detected_lang.lower() == wanted:
+            return (code.strip(), detected_lang or language)
+        found = True
+
+    if not found:
+        # No code blocks found, return original text
+        return (text, language)
+
+    sys.stderr.write(f"No code blocks found for language: {language}\n")
+    return ("", language)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Extract code blocks from markdown text."
+    )
+    parser.add_argument(
+        "-l", "--lang",
+        help="Filter by language (e.g., python, bash, javascript)"
+    )
+    parser.add_argument(
+        "-a", "--all",
+        action="store_true",
+        help="Extract all code blocks (concatenated)"
+    )
+    parser.add_argument(
+        "-s", "--strip-comments",
+        action="store_true",
+        help="Remove comments from extracted code"
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        help="Input file (default: stdin)"
+    )
+
+    args = parser.parse_args()
+
+    # Read input as raw bytes and decode once, bypassing the text layer
+    if args.input:
+        with open(args.input, 'rb') as f:
+            text = f.read().decode('utf-8', errors='replace')
+    else:
+        text = sys.stdin.buffer.read().decode('utf-8', errors='replace')
+    # Binary reads skip universal newline translation, so do it here
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+    # Extract code
+    if args.all:
+        wanted = args.lang.lower() if args.lang else None
+        # A list (not a generator) lets join size its buffer in one pass
+        parts = [code.strip() for lang, code in _iter_blocks(text)
+                 if not wanted or lang.lower() == wanted]
+        code = '\n\n'.join(parts)
+        detected_lang = args.lang
+    else:
+        code, detected_lang = extract_code_blocks(text, args.lang)
+
+    # Ensure shebang is present, and strip comments if requested
+    code = normalize(code, detected_lang, strip=args.strip_comments)
+
+    # Write UTF-8 bytes directly, bypassing the text layer
+    out = sys.stdout.buffer
+    out.write(code.encode('utf-8'))
+    out.write(b'\n')
+    out.flush()
+
+
+if __name__ == "__main__":
+    main()